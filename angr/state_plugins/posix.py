@@ -171,21 +171,22 @@ class SimStateSystem(SimStatePlugin):
         """
         # TODO: speed this up
         fd = None
-        if preferred_fd is not None and preferred_fd not in self.files:
+        files = self.files
+        if preferred_fd is not None and preferred_fd not in files:
             fd = preferred_fd
         else:
             for fd_ in xrange(0, 8192):
-                if fd_ not in self.files:
+                if fd_ not in files:
                     fd = fd_
                     break
         if fd is None:
             raise SimPosixError('exhausted file descriptors')
 
-        if name in self.fs:
-            # we assume we don't need to copy the file object, the file has been created just for us to use.
-            f = self.fs[name]
+        # if the file is already in the fs, we assume we don't need to copy the file object, the file has been created
+        # just for us to use.
+        f = self.fs.get(name)
         # if it's a device file we probably don't want to try to read in the entire thing
-        elif self.concrete_fs and not os.path.abspath(name).startswith("/dev"):
+        if f is None and self.concrete_fs and not os.path.abspath(name).startswith("/dev"):
             # if we're in a chroot update the name
             if self.chroot is not None:
                 # this is NOT a secure implementation of chroot, it is only for convenience
@@ -209,12 +210,12 @@ class SimStateSystem(SimStatePlugin):
                 f = SimFile(name, mode, content=backing, size=len(content))
             else:
                 f = SimFile(name, mode)
-        else:
+        elif f is None:
             f = SimFile(name, mode)
         if self.state is not None:
             f.set_state(self.state)
 
-        self.files[fd] = f
+        files[fd] = f
         self.fs[name] = f
 
         return fd
@@ -354,7 +355,7 @@ class SimStateSystem(SimStatePlugin):
 
     def filename_to_fd(self, name):
         # TODO: replace with something better
-        for fd, f in self.files.items():
+        for fd, f in self.files.iteritems():
             if f.name == name:
                 return fd
 
@@ -402,24 +403,23 @@ class SimStateSystem(SimStatePlugin):
 
     @staticmethod
     def memocopy(x, memo):
-        if id(x) not in memo:
-            memo[id(x)] = x.copy()
-        return memo[id(x)]
+        xid = id(x)
+        c = memo.get(xid)
+        if c is None:
+            c = memo[xid] = x.copy()
+        return c
 
     def copy(self):
-        sockets = {}
         memo = {}
 
         fs = {path:self.memocopy(f,memo) for path,f in self.fs.iteritems()}
         files = { fd:self.memocopy(f,memo) for fd,f in self.files.iteritems() }
-        for f in self.files:
-            if f in self.sockets:
-                sockets[f] = files[f]
+        sockets = { fd:files[fd] for fd in self.sockets if fd in files }
 
         return SimStateSystem(initialize=False, files=files, concrete_fs=self.concrete_fs, chroot=self.chroot, sockets=sockets, pcap_backer=self.pcap, argv=self.argv, argc=self.argc, environ=self.environ, auxv=self.auxv, tls_modules=self.tls_modules, fs=fs, queued_syscall_returns=list(self.queued_syscall_returns), sigmask=self._sigmask, pid=self.pid, brk=self.brk)
 
     def merge(self, others, merge_conditions, common_ancestor=None):
-        all_files = set.union(*(set(o.files.keys()) for o in [ self ] + others))
+        all_files = set(self.files).union(*(o.files for o in others))
 
         merging_occurred = False
         for fd in all_files:
@@ -431,7 +431,7 @@ class SimStateSystem(SimStatePlugin):
         return merging_occurred
 
     def widen(self, others):
-        all_files = set.union(*(set(o.files.keys()) for o in [ self ] + others))
+        all_files = set(self.files).union(*(o.files for o in others))
 
         merging_occurred = False
         for fd in all_files:
@@ -467,7 +467,7 @@ class SimStateSystem(SimStatePlugin):
         :param fd:          A file descriptor.
         :param filename:    The path of the file where to write the data.
         """
-        with open(filename, "w") as f:
+        with open(filename, "wb") as f:
             f.write(self.dumps(fd))
 
     def get_file(self, fd):
@@ -492,7 +492,8 @@ class SimStateSystem(SimStatePlugin):
         take a path and make sure if fits within the chroot
         remove '../', './', and '/' from the beginning of path
         """
-        normalized = os.path.normpath(os.path.abspath(name))
+        # abspath() already normalizes its result
+        normalized = os.path.abspath(name)
 
         # if it starts with the chroot after absolution and normalization it's good
         if normalized.startswith(self.chroot):
@@ -500,17 +501,19 @@ class SimStateSystem(SimStatePlugin):
 
         normalized = os.path.normpath(name)
         # otherwise we trim the path and append it to the chroot
+        # walk an index over the leading components and slice only once at the end
+        start = 0
         while True:
-            if normalized.startswith("/"):
-                normalized = normalized[1:]
-            elif normalized.startswith("./"):
-                normalized = normalized[2:]
-            elif normalized.startswith("../"):
-                normalized = normalized[3:]
+            if normalized.startswith("/", start):
+                start += 1
+            elif normalized.startswith("./", start):
+                start += 2
+            elif normalized.startswith("../", start):
+                start += 3
             else:
                 break
 
-        return os.path.join(self.chroot, normalized)
+        return os.path.join(self.chroot, normalized[start:])
 
 
 SimStatePlugin.register_default('posix', SimStateSystem)
@@ -47,7 +47,8 @@ class SimFile(SimStatePlugin):
 
     # Creates a SimFile
     def __init__(self, name, mode, pos=0, content=None, size=None, closed=None):
-        super(SimFile, self).__init__()
+        # SimStatePlugin.__init__ only sets the state; do it inline since files are created on every open and copy
+        self.state = None
         self.name = name
         self.mode = mode
 
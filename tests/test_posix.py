@@ -4,6 +4,7 @@ import sys
 import nose.tools
 
 from angr import SimState
+from angr.state_plugins import SimStateSystem
 
 def test_file_create():
     # Create a state first
@@ -61,6 +62,14 @@ def test_file_seek():
     nose.tools.assert_equal(r, -1)
     state.posix.close(fd)
 
+def test_chrootize():
+    posix = SimStateSystem(initialize=False, chroot="/tmp/chroot")
+
+    nose.tools.assert_equal(posix._chrootize("/tmp/chroot/etc/passwd"), "/tmp/chroot/etc/passwd")
+    nose.tools.assert_equal(posix._chrootize("/etc/passwd"), "/tmp/chroot/etc/passwd")
+    nose.tools.assert_equal(posix._chrootize("../../etc/passwd"), "/tmp/chroot/etc/passwd")
+    nose.tools.assert_equal(posix._chrootize("///etc/passwd"), "/tmp/chroot/etc/passwd")
+
 def main():
     g = globals()
     if len(sys.argv) > 1: